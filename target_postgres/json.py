@@ -0,0 +1,135 @@
+"""JSON serialization helpers for postgres target."""
+
+from __future__ import annotations
+
+import decimal
+import json
+import re
+from typing import IO, Any, Iterator
+
+import msgspec
+
+# How many bytes `iter_lines` reads from a JSONL stream at a time
+JSONL_BUFFER_SIZE: int = 64 * 1024
+
+# PostgreSQL can not store a NUL character in JSON or JSONB, msgspec
+# escapes it as \u0000.  The look behind skips a backslash that is
+# itself escaped, "\\u0000" is literal text and must be kept.
+NULL_CHARACTER_ESCAPE = re.compile(rb"(?<!\\)((?:\\\\)*)\\u0000")
+
+
+def _default_encoding(obj: Any) -> str:  # noqa: ANN401
+    """Default JSON encoder for types msgspec can not serialize.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        The encoded object.
+    """
+    return str(obj)
+
+
+encoder = msgspec.json.Encoder(enc_hook=_default_encoding, decimal_format="number")
+decoder = msgspec.json.Decoder(float_hook=decimal.Decimal)
+
+
+def _strip_null_characters(data: bytes) -> bytes:
+    """Remove escaped NUL characters from encoded JSON.
+
+    One find over the whole document is far cheaper than checking
+    every nested string, and the regex only runs when a NUL is present.
+
+    Args:
+        data: The encoded JSON.
+
+    Returns:
+        The encoded JSON without NUL characters.
+    """
+    if data.find(b"\\u0000") < 0:
+        return data
+    return NULL_CHARACTER_ESCAPE.sub(rb"\1", data)
+
+
+def serialize_json(obj: object, **kwargs: Any) -> str:  # noqa: ARG001
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: The object to serialize.
+        kwargs: Ignored, kept for drop in compatibility with `json.dumps`.
+
+    Returns:
+        A JSON string.
+    """
+    return _strip_null_characters(encoder.encode(obj)).decode()
+
+
+def serialize_json_bytes(obj: object, **kwargs: Any) -> bytes:  # noqa: ARG001
+    """Serialize an object to JSON encoded as UTF-8 bytes.
+
+    psycopg accepts bytes from a JSON dumps function and sends them as
+    is, which skips decoding to a str only to have it encoded again.
+
+    Args:
+        obj: The object to serialize.
+        kwargs: Ignored, kept for drop in compatibility with `json.dumps`.
+
+    Returns:
+        JSON as bytes.
+    """
+    return _strip_null_characters(encoder.encode(obj))
+
+
+def deserialize_json(json_str: str | bytes, **kwargs: Any) -> object:  # noqa: ARG001
+    """Deserialize a JSON string or bytes to an object.
+
+    msgspec rejects the NaN and Infinity tokens `json.dumps` writes for
+    those floats, a document it can not decode is parsed again with the
+    standard library the way the SDK did.
+
+    Args:
+        json_str: The JSON document to deserialize.
+        kwargs: Ignored, kept for drop in compatibility with `json.loads`.
+
+    Returns:
+        The deserialized object.
+    """
+    try:
+        return decoder.decode(json_str)
+    except msgspec.DecodeError:
+        return json.loads(json_str, parse_float=decimal.Decimal)
+
+
+def iter_lines(stream: IO[bytes], size: int = JSONL_BUFFER_SIZE) -> Iterator[bytes]:
+    """Yield the non empty lines of a binary stream read in large blocks.
+
+    Splitting a whole block at once avoids the per line readline calls
+    a file iterator makes, which is most of the cost with gzip.  Blocks
+    come from `read1` when the stream has it, so a pipe yields the lines
+    it has instead of waiting for a full block.  The pieces of a line
+    longer than a block are only joined once its end is read.
+
+    Args:
+        stream: The binary stream to read.
+        size: How many bytes to read at a time.
+
+    Yields:
+        Each line without its newline.
+    """
+    read = getattr(stream, "read1", stream.read)
+    pending: list[bytes] = []
+    while block := read(size):
+        lines = block.split(b"\n")
+        if len(lines) == 1:
+            pending.append(block)
+            continue
+        if pending:
+            pending.append(lines[0])
+            lines[0] = b"".join(pending)
+            pending = []
+        tail = lines.pop()
+        if tail:
+            pending.append(tail)
+        yield from filter(None, lines)
+    if pending:
+        yield b"".join(pending)
@@ -2,19 +2,73 @@
 
 from __future__ import annotations
 
-from base64 import b64decode
+import atexit
+import io
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, cast
-
+from datetime import timezone
+from decimal import ROUND_HALF_UP, Decimal
+from functools import cached_property
+from itertools import groupby, islice
+from time import perf_counter
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Sized,
+)
+from uuid import UUID
+
+import psycopg
 import sqlalchemy as sa
+from psycopg import pq
+from psycopg.types.json import Json, Jsonb
 from singer_sdk.connectors import SQLConnector
+from singer_sdk.helpers._batch import BaseBatchFileEncoding, BatchFileFormat, StorageTarget
+from singer_sdk.helpers._compat import (
+    date_fromisoformat,
+    datetime_fromisoformat,
+    time_fromisoformat,
+)
+from singer_sdk.helpers._typing import get_datelike_property_type
 from singer_sdk.sinks import SQLSink
 from sqlalchemy import MetaData, Table, engine_from_config, exc, types
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine.url import URL
 
+try:
+    # ISA-L's SIMD inflate when the optional isal is installed
+    from isal.igzip import GzipFile
+except ImportError:
+    from gzip import GzipFile
+
+try:
+    # SIMD accelerated base64 when the optional pybase64 is installed
+    from pybase64 import b64decode
+except ImportError:
+    # base64.b64decode only converts the input and calls this
+    from binascii import a2b_base64 as b64decode
+
+from target_postgres.json import (
+    deserialize_json,
+    iter_lines,
+    serialize_json,
+    serialize_json_bytes,
+)
+
 if TYPE_CHECKING:
+    from singer_sdk.helpers._typing import DatetimeErrorTreatmentEnum
     from sqlalchemy.engine import Engine
 
 
@@ -35,6 +89,295 @@ MSSQL_FLOAT_MAX:Decimal = Decimal("1.79e308")
 MSSQL_REAL_MIN:Decimal = Decimal("-3.40e38")
 MSSQL_REAL_MAX:Decimal = Decimal("3.40e38")
 
+# Rows handed to each executemany call by the insert path
+INSERT_CHUNK_SIZE: int = 1000
+
+# Read size for batch files, the default 8 KiB makes gzip
+# decompression loop through far more small reads
+READ_BUFFER_SIZE: int = 128 * 1024
+
+# Largest batch the autotune_batch_size setting will grow to
+MAX_TUNED_BATCH_SIZE: int = 200_000
+
+# Postgres types for the JSON string formats hd_jsonschema_types maps
+STRING_FORMAT_TYPES: dict[str, type[sa.types.TypeEngine]] = {
+    "date": postgresql.DATE,
+    "time": postgresql.TIME,
+    "date-time": postgresql.TIMESTAMP,
+    "uuid": postgresql.UUID,
+}
+
+# Postgres types for the MSSQL (minimum, maximum) ranges.  Equal int,
+# float and Decimal values hash the same, so a lookup matches whichever
+# numeric type the schema was decoded with.
+INTEGER_RANGE_TYPES: dict[tuple[Any, Any], type[sa.types.TypeEngine]] = {
+    (MSSQL_BIGINT_MIN, MSSQL_BIGINT_MAX): postgresql.BIGINT,
+    (MSSQL_INT_MIN, MSSQL_INT_MAX): postgresql.INTEGER,
+    (MSSQL_SMALLINT_MIN, MSSQL_SMALLINT_MAX): postgresql.SMALLINT,
+    # This is a MSSQL only DataType of TINYINT
+    (MSSQL_TINYINT_MIN, MSSQL_TINYINT_MAX): postgresql.SMALLINT,
+}
+NUMBER_RANGE_TYPES: dict[tuple[Any, Any], type[sa.types.TypeEngine]] = {
+    # There is something that is traucating and rounding this number
+    # if (minimum == -922337203685477.5808) and (maximum == 922337203685477.5807):
+    (MSSQL_MONEY_MIN, MSSQL_MONEY_MAX): postgresql.MONEY,
+    # This is a MSSQL only DataType of SMALLMONEY
+    (MSSQL_SMALLMONEY_MIN, MSSQL_SMALLMONEY_MAX): postgresql.MONEY,
+    (MSSQL_FLOAT_MIN, MSSQL_FLOAT_MAX): postgresql.FLOAT,
+    (MSSQL_REAL_MIN, MSSQL_REAL_MAX): postgresql.REAL,
+}
+
+# Non unique indexes of a table that no constraint depends on, these
+# are safe to drop during a load and build again afterwards
+SECONDARY_INDEXES = sa.text(
+    """
+    SELECT quote_ident(n.nspname) || '.' || quote_ident(i.relname),
+           pg_get_indexdef(i.oid)
+    FROM pg_index x
+    JOIN pg_class i ON i.oid = x.indexrelid
+    JOIN pg_namespace n ON n.oid = i.relnamespace
+    WHERE x.indrelid = CAST(:table_name AS regclass)
+      AND NOT x.indisunique
+      AND NOT x.indisprimary
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)
+    """
+)
+
+# Type modifiers like the (10, 2) in NUMERIC(10, 2) are not part
+# of the type names psycopg knows about
+TYPE_MODIFIERS = re.compile(r"\(.*?\)")
+
+# The start of a CREATE INDEX statement from pg_get_indexdef
+INDEX_CREATE = re.compile(r"^CREATE INDEX ")
+
+# SQL standard type names postgres stores under another name, without
+# a precision FLOAT is a double precision
+TYPE_ALIASES: dict[str, str] = {
+    "decimal": "numeric",
+    "float": "double precision",
+}
+
+
+def concurrent_index_definition(index_definition: str) -> str:
+    """Rewrite a `pg_get_indexdef` definition to build the index concurrently.
+
+    Args:
+        index_definition: A `CREATE INDEX name ON ...` statement.
+
+    Returns:
+        The statement as `CREATE INDEX CONCURRENTLY IF NOT EXISTS name ON ...`.
+    """
+    return INDEX_CREATE.sub(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ", index_definition, count=1
+    )
+
+
+def _copy_date(value: Any) -> Any:  # noqa: ANN401
+    return date_fromisoformat(value) if isinstance(value, str) else value
+
+
+def _copy_time(value: Any) -> Any:  # noqa: ANN401
+    return time_fromisoformat(value) if isinstance(value, str) else value
+
+
+def _copy_datetime(value: Any) -> Any:  # noqa: ANN401
+    # The SDK's fromisoformat accepts a trailing Z before Python 3.11
+    return datetime_fromisoformat(value) if isinstance(value, str) else value
+
+
+def _copy_naive_datetime(value: Any) -> Any:  # noqa: ANN401
+    """Convert a value for a `timestamp` column without a time zone.
+
+    The binary `timestamp` dumper only takes naive datetimes, so an
+    aware value is converted to UTC and its time zone dropped.
+
+    Args:
+        value: A datetime or an ISO 8601 string.
+
+    Returns:
+        A naive datetime in UTC.
+    """
+    value = _copy_datetime(value)
+    if getattr(value, "tzinfo", None) is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _copy_text(value: Any) -> Any:  # noqa: ANN401
+    """Convert a value for a text column, as the server casts it.
+
+    Args:
+        value: Any value a record can hold.
+
+    Returns:
+        The value as a str.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return serialize_json(value)
+    return str(value)
+
+
+def _copy_integer(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, int):
+        return value
+    # A fractional value is rounded as the cast of a numeric would
+    if isinstance(value, float):
+        value = str(value)
+    return int(Decimal(value).to_integral_value(ROUND_HALF_UP))
+
+
+def _copy_numeric(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, (int, Decimal)):
+        return value
+    # str of a float is its shortest repr, and keeps NaN and Infinity
+    return Decimal(str(value) if isinstance(value, float) else value)
+
+
+def _copy_float(value: Any) -> Any:  # noqa: ANN401
+    return float(value) if isinstance(value, str) else value
+
+
+def _copy_uuid(value: Any) -> Any:  # noqa: ANN401
+    return UUID(value) if isinstance(value, str) else value
+
+
+def _copy_json(value: Any) -> Any:  # noqa: ANN401
+    return Json(value, dumps=serialize_json_bytes)
+
+
+def _copy_jsonb(value: Any) -> Any:  # noqa: ANN401
+    return Jsonb(value, dumps=serialize_json_bytes)
+
+
+def _csv_quote(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _csv_value(value: Any) -> str:  # noqa: ANN401, PLR0911
+    """Format a value as a field of `COPY ... (FORMAT CSV)`.
+
+    Only NULL is written as an unquoted empty field, every string is
+    quoted so an empty string is not read back as NULL.
+
+    Args:
+        value: The value to format.
+
+    Returns:
+        The CSV field.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return _csv_quote(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex format, backslashes are not special in CSV
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, (dict, list)):
+        return _csv_quote(serialize_json(value))
+    return _csv_quote(str(value))
+
+
+def _csv_text(value: Any) -> str:  # noqa: ANN401
+    if type(value) is str:
+        return '"' + value.replace('"', '""') + '"'
+    return _csv_value(value)
+
+
+def _csv_number(value: Any) -> str:  # noqa: ANN401
+    if type(value) in {int, float, Decimal}:
+        return str(value)
+    return _csv_value(value)
+
+
+def _csv_json(value: Any) -> str:  # noqa: ANN401
+    # Every value of a JSON column is encoded, a str included
+    return "" if value is None else _csv_quote(serialize_json(value))
+
+
+def _csv_base64(value: Any) -> str:  # noqa: ANN401
+    """Format a base64 encoded value as a bytea CSV field.
+
+    Args:
+        value: The base64 text, or bytes that were already decoded.
+
+    Returns:
+        The CSV field.
+    """
+    if isinstance(value, str):
+        return "\\x" + b64decode(value).hex()
+    return _csv_value(value)
+
+
+def _last_record_per_key(
+    records: Iterable[dict[str, Any]],
+    keys: Sequence[str],
+) -> list[dict[str, Any]]:
+    """Keep only the last record of each key, in the order keys first appear.
+
+    Args:
+        records: The conformed records.
+        keys: The key columns.
+
+    Returns:
+        One record per distinct key.
+    """
+    latest = {tuple(record.get(key) for key in keys): record for record in records}
+    return list(latest.values())
+
+
+class _LineReader(io.RawIOBase):
+    """A readable binary stream over lines that are produced on demand.
+
+    Lines are only encoded as the reader asks for more bytes, so a COPY
+    never needs the whole batch in memory.
+    """
+
+    def __init__(self, lines: Iterator[str], encoding: str = "utf-8") -> None:
+        """Create the reader.
+
+        Args:
+            lines: The lines to send, each ending with a newline.
+            encoding: The encoding the server expects.
+        """
+        super().__init__()
+        self._lines = lines
+        self._encoding = encoding
+        self._pending = bytearray()
+
+    def readable(self) -> bool:
+        """The stream is readable.
+
+        Returns:
+            Always True.
+        """
+        return True
+
+    def readinto(self, buffer: memoryview) -> int:  # type: ignore[override]
+        """Fill the buffer with the next encoded lines.
+
+        Args:
+            buffer: The buffer to fill.
+
+        Returns:
+            The number of bytes written, 0 once every line has been read.
+        """
+        size = len(buffer)
+        pending = self._pending
+        while len(pending) < size and (line := next(self._lines, None)) is not None:
+            pending += line.encode(self._encoding)
+        count = min(size, len(pending))
+        buffer[:count] = pending[:count]
+        del pending[:count]
+        return count
+
 
 class PostgresConnector(SQLConnector):
     """The connector for postgres.
@@ -45,15 +388,281 @@ class PostgresConnector(SQLConnector):
     allow_column_add: bool = True  # Whether ADD COLUMN is supported.
     allow_column_rename: bool = True  # Whether RENAME COLUMN is supported.
     allow_column_alter: bool = False  # Whether altering column types is supported.
-    allow_merge_upsert: bool = False  # Whether MERGE UPSERT is supported.
+    allow_merge_upsert: bool = True  # Whether MERGE UPSERT is supported.
     allow_overwrite: bool = False  # Whether overwrite load method is supported.
     allow_temp_tables: bool = True  # Whether temp tables are supported.
 
+    def __init__(
+        self,
+        config: dict | None = None,
+        sqlalchemy_url: str | None = None,
+    ) -> None:
+        """Initialize the SQL connector.
+
+        Args:
+            config: The parent tap or target object's config.
+            sqlalchemy_url: Optional URL for the connection.
+        """
+        super().__init__(config=config, sqlalchemy_url=sqlalchemy_url)
+        # SQL types already resolved for a JSON Schema fragment
+        self._sql_type_cache: dict[
+            str, tuple[type[sa.types.TypeEngine], dict[str, Any]]
+        ] = {}
+        # Tables already reflected from the server, sinks share these
+        self._reflected_tables: dict[tuple[str | None, str], Table] = {}
+        self._reflected_metadata = MetaData()
+        self._reflect_lock = threading.Lock()
+        self._insert_statements: dict[tuple[str | None, str], sa.Insert] = {}
+        self._upsert_statements: dict[
+            tuple[str | None, str], tuple[tuple[str, ...], sa.Insert]
+        ] = {}
+        self._parsed_table_names: dict[str, tuple[str | None, str | None, str]] = {}
+        # Definitions of the indexes dropped for a load, by table, kept
+        # here so any sink of the table, or exit, can build them again
+        self._dropped_indexes: dict[tuple[str | None, str], list[str]] = {}
+
     @contextmanager
     def _connect(self) -> Iterator[sa.engine.Connection]:
         with self._engine.connect() as conn:
             yield conn
 
+    def parse_full_table_name(
+        self,
+        full_table_name: str,
+    ) -> tuple[str | None, str | None, str]:
+        """Parse a fully qualified table name into its parts, once per name.
+
+        Args:
+            full_table_name: A table name or a fully qualified table name.
+
+        Returns:
+            A three part tuple (db_name, schema_name, table_name).
+        """
+        parsed = self._parsed_table_names.get(full_table_name)
+        if parsed is None:
+            parsed = super().parse_full_table_name(full_table_name)
+            self._parsed_table_names[full_table_name] = parsed
+        return parsed
+
+    def reflect_table(self, full_table_name: str) -> Table:
+        """Return the target table, reflecting it from the server only once.
+
+        Args:
+            full_table_name: the target table name.
+
+        Returns:
+            The reflected table object.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        key = (schema_name, table_name)
+        with self._reflect_lock:
+            table = self._reflected_tables.get(key)
+            if table is None:
+                # This is the Table instance that will autoload
+                # all the info about the table from the target server
+                table = Table(
+                    table_name,
+                    self._reflected_metadata,
+                    autoload_with=self._engine,
+                    schema=schema_name,
+                )
+                self._reflected_tables[key] = table
+        return table
+
+    def get_table(
+        self,
+        full_table_name: str,
+        column_names: list[str] | None = None,
+    ) -> Table:
+        """Return a table object, from the reflection cache for all columns.
+
+        Args:
+            full_table_name: Fully qualified table name.
+            column_names: A list of column names to filter to.
+
+        Returns:
+            The table object.
+        """
+        if column_names is None:
+            return self.reflect_table(full_table_name)
+        return super().get_table(full_table_name, column_names)
+
+    def insert_statement(self, full_table_name: str) -> sa.Insert:
+        """Return the insert statement for a table, building it only once.
+
+        Reusing one statement object lets every batch hit SQLAlchemy's
+        compiled cache instead of building and hashing a new construct.
+
+        Args:
+            full_table_name: the target table name.
+
+        Returns:
+            An insert statement for all columns of the table.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        key = (schema_name, table_name)
+        statement = self._insert_statements.get(key)
+        if statement is None:
+            statement = self.reflect_table(full_table_name).insert()
+            self._insert_statements[key] = statement
+        return statement
+
+    def upsert_statement(self, full_table_name: str, keys: Sequence[str]) -> sa.Insert:
+        """Return the `ON CONFLICT` insert for a table, building it only once.
+
+        Args:
+            full_table_name: the target table name.
+            keys: The key columns the conflict is matched on.
+
+        Returns:
+            An insert that updates every other column of a conflicting row
+            that changed, or skips the row when the table only has key
+            columns.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        key = (schema_name, table_name)
+        cached_keys, statement = self._upsert_statements.get(key, ((), None))
+        if statement is None or cached_keys != tuple(keys):
+            table = self.reflect_table(full_table_name)
+            statement = postgresql.insert(table)
+            updates = [
+                column.name for column in table.columns if column.name not in keys
+            ]
+            if updates:
+                excluded = statement.excluded
+                changed = None
+                # Skip rewriting rows that did not change, json has no
+                # equality operator so tables with it always update
+                if not any(
+                    isinstance(column.type, sa.types.JSON)
+                    and not isinstance(column.type, postgresql.JSONB)
+                    for column in table.columns
+                ):
+                    current = sa.tuple_(*(table.c[name] for name in updates))
+                    changed = current.is_distinct_from(
+                        sa.tuple_(*(excluded[name] for name in updates))
+                    )
+                statement = statement.on_conflict_do_update(
+                    index_elements=keys,
+                    set_={name: excluded[name] for name in updates},
+                    where=changed,
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=keys)
+            self._upsert_statements[key] = (tuple(keys), statement)
+        return statement
+
+    def drop_secondary_indexes(self, full_table_name: str) -> None:
+        """Drop the secondary indexes of a table for the length of a load.
+
+        Every loaded row has to update each index, so non unique indexes
+        that do not back a constraint are dropped before the first batch
+        and built again in one pass by `recreate_indexes`.  Indexes still
+        dropped when the process exits are built again then.
+
+        Args:
+            full_table_name: the target table name.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        preparer = self._engine.dialect.identifier_preparer
+        table = preparer.format_table(self.reflect_table(full_table_name))
+        with self._connect() as conn, conn.begin():
+            indexes = conn.execute(SECONDARY_INDEXES, {"table_name": table}).all()
+            for index_name, index_definition in indexes:
+                # Logged so an index can be restored by hand if the run dies
+                self.logger.info("Dropping index for the load: %s", index_definition)
+                conn.execute(sa.text(f"DROP INDEX {index_name}"))
+        if not indexes:
+            return
+        self._dropped_indexes.setdefault((schema_name, table_name), []).extend(
+            definition for _, definition in indexes
+        )
+        # Registered once, a run that fails still puts the indexes back
+        atexit.unregister(self.recreate_all_indexes)
+        atexit.register(self.recreate_all_indexes)
+
+    def recreate_indexes(self, full_table_name: str) -> None:
+        """Build the indexes dropped from a table by `drop_secondary_indexes`.
+
+        Args:
+            full_table_name: the target table name.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        self._recreate_indexes((schema_name, table_name))
+
+    def recreate_all_indexes(self) -> None:
+        """Build every index that is still dropped for a load."""
+        for key in list(self._dropped_indexes):
+            self._recreate_indexes(key)
+
+    def _recreate_indexes(self, key: tuple[str | None, str]) -> None:
+        """Build the dropped indexes of one table.
+
+        Indexes are built `CONCURRENTLY`, which can not run in a
+        transaction, so writes to the table are not blocked meanwhile.
+
+        Args:
+            key: The (schema name, table name) of the table.
+        """
+        definitions = self._dropped_indexes.pop(key, None)
+        if not definitions:
+            return
+        with self._engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            for index_definition in definitions:
+                self.logger.info("Recreating index: %s", index_definition)
+                conn.execute(sa.text(concurrent_index_definition(index_definition)))
+
+    def _forget_table(self, full_table_name: str) -> None:
+        """Drop a reflected table so the next lookup sees its new definition.
+
+        Args:
+            full_table_name: the target table name.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        with self._reflect_lock:
+            self._insert_statements.pop((schema_name, table_name), None)
+            self._upsert_statements.pop((schema_name, table_name), None)
+            table = self._reflected_tables.pop((schema_name, table_name), None)
+            if table is not None:
+                self._reflected_metadata.remove(table)
+
+    def _create_empty_column(
+        self,
+        full_table_name: str,
+        column_name: str,
+        sql_type: sa.types.TypeEngine,
+    ) -> None:
+        """Create a new column and forget the cached table definition.
+
+        Args:
+            full_table_name: The target table name.
+            column_name: The name of the new column.
+            sql_type: SQLAlchemy type engine to be used in creating the new column.
+        """
+        super()._create_empty_column(full_table_name, column_name, sql_type)
+        self._forget_table(full_table_name)
+
+    def _adapt_column_type(
+        self,
+        full_table_name: str,
+        column_name: str,
+        sql_type: sa.types.TypeEngine,
+    ) -> None:
+        """Adapt a column type, forgetting the cached table if it was altered.
+
+        Args:
+            full_table_name: The target table name.
+            column_name: The target column name.
+            sql_type: The new SQLAlchemy type.
+        """
+        current_type = str(self._get_column_type(full_table_name, column_name))
+        super()._adapt_column_type(full_table_name, column_name, sql_type)
+        # Most calls find the column already fits and alter nothing, the
+        # cached table and statements stay valid unless the type changed
+        if str(self._get_column_type(full_table_name, column_name)) != current_type:
+            self._forget_table(full_table_name)
+
     def get_sqlalchemy_url(self, config: dict) -> str:
         """Return the SQLAlchemy URL string.
 
@@ -90,21 +699,70 @@ class PostgresConnector(SQLConnector):
         Returns:
             A newly created SQLAlchemy engine object.
         """
+        # psycopg takes JSON as bytes, the other drivers need a str
+        json_serializer = (
+            serialize_json_bytes
+            if self.config.get("driver_type") == "psycopg"
+            else self.serialize_json
+        )
         eng_prefix = "ep."
         eng_config = {
             f"{eng_prefix}url": self.sqlalchemy_url,
-            f"{eng_prefix}echo": "False",
-            f"{eng_prefix}json_serializer": self.serialize_json,
+            f"{eng_prefix}echo": False,
+            f"{eng_prefix}json_serializer": json_serializer,
             f"{eng_prefix}json_deserializer": self.deserialize_json,
+            # Test pooled connections on checkout and replace any older
+            # than half an hour, a dropped one then never fails a load
+            f"{eng_prefix}pool_pre_ping": True,
+            f"{eng_prefix}pool_recycle": 1800,
+            # Each parallel drain checks out a connection for the length
+            # of the batch, keep enough of them idle in the pool to be
+            # reused instead of opening overflow connections
+            f"{eng_prefix}pool_size": max(5, os.cpu_count() or 1),
         }
 
+        # psycopg2 batches executemany into multi row statements, these
+        # options only exist on its dialect and user settings override them
+        if self.config.get("driver_type") in {"psycopg2", "psycopg2cffi"}:
+            eng_config.update(
+                {
+                    f"{eng_prefix}executemany_mode": "values_plus_batch",
+                    f"{eng_prefix}insertmanyvalues_page_size": INSERT_CHUNK_SIZE,
+                    f"{eng_prefix}executemany_batch_page_size": 500,
+                }
+            )
+
         if self.config.get("sqlalchemy_eng_params"):
             for key, value in self.config["sqlalchemy_eng_params"].items():
                 eng_config.update({f"{eng_prefix}{key}": value})
 
         return engine_from_config(eng_config, prefix=eng_prefix)
 
-    def to_sql_type(self, jsonschema_type: dict) -> None:
+    @staticmethod
+    def serialize_json(obj: object) -> str:
+        """Serialize an object to a JSON string for JSON columns.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            The JSON string.
+        """
+        return serialize_json(obj)
+
+    @staticmethod
+    def deserialize_json(json_str: str) -> object:
+        """Deserialize a JSON string read from JSON columns.
+
+        Args:
+            json_str: The JSON string to deserialize.
+
+        Returns:
+            The deserialized object.
+        """
+        return deserialize_json(json_str)
+
+    def to_sql_type(self, jsonschema_type: dict) -> sa.types.TypeEngine:
         """Return a JSON Schema representation of the provided type.
 
         By default will call `typing.to_sql_type()`.
@@ -120,11 +778,31 @@ class PostgresConnector(SQLConnector):
         Returns:
             The SQLAlchemy type representation of the data type.
         """
-        msg = f"json schema type: {jsonschema_type}"
-        self.logger.info(msg)
+        # Wide schemas repeat the same handful of column definitions,
+        # the whole fragment is the key so nothing that changes the
+        # resulting type can be missed.
+        # The class and its constructor arguments are kept rather than
+        # the instance, callers such as update_collation change the type
+        # they are given and each must get its own.
+        cache_key = json.dumps(jsonschema_type, sort_keys=True, default=str)
+        cached = self._sql_type_cache.get(cache_key)
+        if cached is not None:
+            sql_type_class, kwargs = cached
+            return sql_type_class(**kwargs)
+
+        self.logger.info("json schema type: %s", jsonschema_type)
         if self.config.get("hd_jsonschema_types", False):
-            return self.hd_to_sql_type(jsonschema_type)
-        return self.org_to_sql_type(jsonschema_type)
+            sql_type = self.hd_to_sql_type(jsonschema_type)
+        else:
+            sql_type = self.org_to_sql_type(jsonschema_type)
+        sql_type_class = type(sql_type)
+        kwargs = {
+            name: sql_type.__dict__[name]
+            for name in sa.util.get_cls_kwargs(sql_type_class)
+            if name in sql_type.__dict__
+        }
+        self._sql_type_cache[cache_key] = (sql_type_class, kwargs)
+        return sql_type
 
     @staticmethod
     def org_to_sql_type(jsonschema_type: dict) -> sa.types.TypeEngine:
@@ -144,7 +822,7 @@ class PostgresConnector(SQLConnector):
             The SQLAlchemy type representation of the data type.
         """
         if jsonschema_type.get("format") == "date-time":
-            return cast(types.TypeEngine, sa.types.TIMESTAMP())
+            return sa.types.TIMESTAMP()
 
         return SQLConnector.to_sql_type(jsonschema_type)
 
@@ -165,76 +843,66 @@ class PostgresConnector(SQLConnector):
         Returns:
             The SQLAlchemy type representation of the data type.
         """
+        json_type = jsonschema_type.get("type")
+
         # JSON Strings to Postgres
-        if "string" in jsonschema_type.get("type"):
-            if jsonschema_type.get("format") == "date":
-                return cast(sa.types.TypeEngine, postgresql.DATE())
-            if jsonschema_type.get("format") == "time":
-                return cast(sa.types.TypeEngine, postgresql.TIME())
-            if jsonschema_type.get("format") == "date-time":
-                return cast(sa.types.TypeEngine, postgresql.TIMESTAMP())
-            if jsonschema_type.get("format") == "uuid":
-                return cast(sa.types.TypeEngine, postgresql.UUID())
+        if "string" in json_type:
+            string_format = STRING_FORMAT_TYPES.get(jsonschema_type.get("format"))
+            if string_format is not None:
+                return string_format()
             if jsonschema_type.get("contentMediaType") == "application/xml":
-                return cast(sa.types.TypeEngine, postgresql.TEXT())
+                return postgresql.TEXT()
             length: int = jsonschema_type.get("maxLength")
             if jsonschema_type.get("contentEncoding") == "base64":
                 if length:
-                    return cast(sa.types.TypeEngine, postgresql.BYTEA(length=length))
-                return cast(sa.types.TypeEngine, postgresql.BYTEA())
+                    return postgresql.BYTEA(length=length)
+                return postgresql.BYTEA()
             if length:
-                return cast(sa.types.TypeEngine,  postgresql.VARCHAR(length=length))
-            return cast(sa.types.TypeEngine, postgresql.VARCHAR())
+                return postgresql.VARCHAR(length=length)
+            return postgresql.VARCHAR()
 
         # JSON Boolean to Postgres
-        if "boolean" in jsonschema_type.get("type"):
-            return cast(types.TypeEngine, postgresql.BOOLEAN())
+        if "boolean" in json_type:
+            return postgresql.BOOLEAN()
 
         # JSON Integers to Postgres
-        if "integer" in jsonschema_type.get("type"):
+        if "integer" in json_type:
             minimum = jsonschema_type.get("minimum")
             maximum = jsonschema_type.get("maximum")
-            if (minimum == MSSQL_BIGINT_MIN) and (maximum == MSSQL_BIGINT_MAX):
-                return cast(sa.types.TypeEngine, postgresql.BIGINT())
-            if (minimum == MSSQL_INT_MIN) and (maximum == MSSQL_INT_MAX):
-                return cast(sa.types.TypeEngine, postgresql.INTEGER())
-            if (minimum == MSSQL_SMALLINT_MIN) and (maximum == MSSQL_SMALLINT_MAX):
-                return cast(sa.types.TypeEngine, postgresql.SMALLINT())
-            if (minimum == MSSQL_TINYINT_MIN) and (maximum == MSSQL_TINYINT_MAX):
-                # This is a MSSQL only DataType of TINYINT
-                return cast(sa.types.TypeEngine, postgresql.SMALLINT())
-            precision = str(maximum).count("9")
-            return cast(sa.types.TypeEngine, postgresql.NUMERIC(precision=precision, scale=0))
+            integer_type = INTEGER_RANGE_TYPES.get((minimum, maximum))
+            if integer_type is not None:
+                return integer_type()
+            if maximum is None:
+                return postgresql.NUMERIC(scale=0)
+            # The number of digits in the maximum is the precision, exact
+            # for any size of int where log10 on a float can be off by one
+            precision = len(Decimal(int(maximum)).as_tuple().digits)
+            return postgresql.NUMERIC(precision=precision, scale=0)
 
         # JSON Numbers to Postgres
-        if "number" in jsonschema_type.get("type"):
+        if "number" in json_type:
             minimum = jsonschema_type.get("minimum")
             maximum = jsonschema_type.get("maximum")
-            # There is something that is traucating and rounding this number
-            # if (minimum == -922337203685477.5808) and (maximum == 922337203685477.5807):
-            if (minimum == MSSQL_MONEY_MIN) and (maximum == MSSQL_MONEY_MAX):
-                return cast(sa.types.TypeEngine, postgresql.MONEY())
-            if (minimum == MSSQL_SMALLMONEY_MIN) and (maximum == MSSQL_SMALLMONEY_MAX):
-                # This is a MSSQL only DataType of SMALLMONEY
-                return cast(sa.types.TypeEngine, postgresql.MONEY())
-            if (minimum == MSSQL_FLOAT_MIN) and (maximum == MSSQL_FLOAT_MAX):
-                return cast(sa.types.TypeEngine, postgresql.FLOAT())
-            if (minimum == MSSQL_REAL_MIN) and (maximum == MSSQL_REAL_MAX):
-                return cast(sa.types.TypeEngine, postgresql.REAL())
-            # Python will start using scientific notition for float values.
-            # A check for 'e+' in the string of the value is what I key on.
-            # If it is no present we can count the number of '9' chars.
-            # If it is present we need to do a little more to translate.
-            if "e+" not in str(maximum).lower():
-                precision = str(maximum).count('9')
-                scale = precision - str(maximum).rfind('.')
-                return cast(sa.types.TypeEngine, postgresql.NUMERIC(precision=precision, scale=scale))
-            precision_start = str(maximum).rfind('+')
-            precision = int(str(maximum)[precision_start:])
-            scale_start = str(maximum).find('.') + 1
-            scale_end = str(maximum).lower().find('e')
-            scale = scale_end - scale_start
-            return cast(sa.types.TypeEngine, postgresql.NUMERIC(precision=precision, scale=scale))
+            number_type = NUMBER_RANGE_TYPES.get((minimum, maximum))
+            if number_type is not None:
+                return number_type()
+            if maximum is None:
+                return postgresql.NUMERIC()
+            # Python will start using scientific notition for large values.
+            # When the exponent is positive it holds the precision and the
+            # digits after the decimal point of the mantissa are the scale.
+            # Otherwise the digits are the precision and the negative
+            # exponent is the scale.  The decimal tuple gives both directly.
+            if not isinstance(maximum, Decimal):
+                maximum = Decimal(str(maximum))
+            _, digits, exponent = maximum.as_tuple()
+            if exponent > 0:
+                precision = exponent + len(digits) - 1
+                scale = len(digits) - 1
+            else:
+                precision = len(digits)
+                scale = -exponent
+            return postgresql.NUMERIC(precision=precision, scale=scale)
 
         return SQLConnector.to_sql_type(jsonschema_type)
 
@@ -246,7 +914,7 @@ class PostgresConnector(SQLConnector):
         partition_keys: list[str] | None = None,
         as_temp_table: bool = False,  # noqa: FBT001, FBT002
     ) -> None:
-        """Create an empty target table.
+        """Create an empty target table and forget any cached definition.
 
         Args:
             full_table_name: the target table name.
@@ -293,6 +961,9 @@ class PostgresConnector(SQLConnector):
                 )
 
         sa.Table(table_name, meta, *columns).create(self._engine)
+        # The overwrite load method drops the table and creates it again,
+        # a reflection cached before then has the old columns
+        self._forget_table(full_table_name)
 
 
 class PostgresSink(SQLSink):
@@ -301,6 +972,12 @@ class PostgresSink(SQLSink):
     connector_class = PostgresConnector
 
     _target_table: Table = None
+    _preprocess: Callable[[dict], dict] | None = None
+    _needs_preprocess: bool | None = None
+    _tuned_max_size: int | None = None
+    _best_max_size: int | None = None
+    _best_rate: float = 0.0
+    _tuning_done: bool = False
 
     @property
     def target_table(self) -> Table:
@@ -336,6 +1013,99 @@ class PostgresSink(SQLSink):
         return name
         # return super().conform_name(name)
 
+    @cached_property
+    def _conformed_key_map(self) -> dict[str, str]:
+        """Map every schema property to its conformed column name.
+
+        Returns:
+            A mapping of property name to column name.
+        """
+        names = {
+            key: self.conform_name(key, "column")
+            for key in self.schema.get("properties", {})
+        }
+        self._check_conformed_names_not_duplicated(names)
+        return names
+
+    @cached_property
+    def _keys_conformed(self) -> bool:
+        """Whether every schema property is already a conformed name.
+
+        Returns:
+            True when conforming would leave all property names unchanged.
+        """
+        return all(key == name for key, name in self._conformed_key_map.items())
+
+    @cached_property
+    def _datelike_columns(self) -> frozenset[str]:
+        """Names of the schema properties holding a date, time or date-time.
+
+        Returns:
+            The date like property names.
+        """
+        properties: dict = self.schema.get("properties", {})
+        return frozenset(
+            key
+            for key, property_schema in properties.items()
+            if get_datelike_property_type(property_schema)
+        )
+
+    def _parse_timestamps_in_record(
+        self,
+        record: dict,
+        schema: dict,
+        treatment: DatetimeErrorTreatmentEnum,
+    ) -> None:
+        """Parse strings to datetime.datetime values, repairing or erroring on failure.
+
+        Streams without date like properties skip the walk over every
+        record value, unless the record has a property missing from the
+        schema that the SDK should warn about.
+
+        Args:
+            record: Individual record in the stream.
+            schema: The stream schema.
+            treatment: How to handle values that fail to parse.
+        """
+        if (
+            schema is self.schema
+            and not self._datelike_columns
+            and record.keys() <= schema.get("properties", {}).keys()
+        ):
+            return
+        super()._parse_timestamps_in_record(record, schema, treatment)
+
+    def conform_record(self, record: dict) -> dict:
+        """Return record dictionary with property names conformed.
+
+        Conformed names are worked out once per property and kept in a
+        map, so each record is a dictionary lookup per column rather
+        than a `conform_name` call.  When no name changes the record is
+        returned as is.
+
+        Args:
+            record: Individual record in the stream.
+
+        Returns:
+            The record with conformed property names.
+        """
+        names = self._conformed_key_map
+        if self._keys_conformed and record.keys() <= names.keys():
+            return record
+        try:
+            return {names[key]: value for key, value in record.items()}
+        except KeyError:
+            # A property that is not in the schema, conform and remember it
+            for key in record:
+                if key not in names:
+                    names[key] = self.conform_name(key, "column")
+                    if names[key] != key:
+                        self._keys_conformed = False
+            self._check_conformed_names_not_duplicated(
+                {key: names[key] for key in record}
+            )
+            return {names[key]: value for key, value in record.items()}
+
     def preprocess_record(self, record: dict, context: dict) -> dict:  # noqa: ARG002
         """Process incoming record and return a modified result.
 
@@ -346,40 +1116,240 @@ class PostgresSink(SQLSink):
         Returns:
             A new, processed record.
         """
+        if self._needs_preprocess is None:
+            self._preprocess = self._compile_preprocess()
+            self._needs_preprocess = self._preprocess is not None
+        if not self._needs_preprocess:
+            return record
+        return self._preprocess(record)
+
+    @cached_property
+    def _nulls_removed(self) -> list[int]:
+        """Count of values the preprocessor removed null characters from.
+
+        Returns:
+            A single item list the generated preprocessor increments.
+        """
+        return [0]
+
+    @cached_property
+    def _column_ops(self) -> dict[str, tuple[bool, bool]]:
+        """Work out once which columns of the stream need preprocessing.
+
+        Returns:
+            A mapping of column name to (strip null characters, decode
+            base64) for every column that needs either.
+        """
         # Get the Stream Properties Dictornary from the Schema
-        properties: dict = self.schema.get("properties")
-
-        for key, value in record.items():
-            if value is not None:
-                # Get the Item/Column property
-                property_schema: dict = properties.get(key)
-                # PostgreSQL does not filter out Null characters
-                # presence of these characters will cause
-                # the target to fail out
-                if isinstance(value, str) and "\x00" in value:
-                    record.update({key: value.replace("\x00", "")})
-                    self.logger.info("Removed Null Character(s) From a Record")
-                # Decode base64 binary fields in record
-                if property_schema.get("contentEncoding") == "base64":
-                    record.update({key: b64decode(value)})
-
-        return record
+        properties: dict = self.schema.get("properties", {})
+
+        column_ops: dict[str, tuple[bool, bool]] = {}
+        for key, property_schema in properties.items():
+            # Decode base64 binary fields in record
+            if property_schema.get("contentEncoding") == "base64":
+                column_ops[key] = (False, True)
+            # PostgreSQL does not filter out Null characters
+            # presence of these characters will cause
+            # the target to fail out
+            elif "string" in property_schema.get("type", "string"):
+                column_ops[key] = (True, False)
+        return column_ops
+
+    @cached_property
+    def _csv_decodes_base64(self) -> bool:
+        """Whether base64 columns are decoded while writing COPY CSV rows.
+
+        Returns:
+            True when every batch is loaded by `copy_csv`.
+        """
+        driver = self.connector._engine.dialect.driver  # noqa: SLF001
+        return driver == "psycopg2" and self.config.get("bulk_load_mode") == "copy"
+
+    def _load_path(self, records: Iterable[dict[str, Any]]) -> str:
+        """Pick how a batch is loaded from `bulk_load_mode` and the driver.
+
+        COPY is limited by bandwidth and INSERTs by round trips, in auto
+        mode psycopg2 sends batches smaller than INSERT_CHUNK_SIZE as one
+        `execute_values` page and copies anything larger.
+
+        Args:
+            records: the batch records.
+
+        Returns:
+            The name of the load method, or "insert" for a SQLAlchemy insert.
+        """
+        mode = self.config.get("bulk_load_mode", "auto")
+        driver = self.connector._engine.dialect.driver  # noqa: SLF001
+        if driver == "psycopg" and mode in {"auto", "copy"}:
+            return "copy_records"
+        if driver == "psycopg2":
+            if mode == "auto":
+                small = isinstance(records, Sized) and len(records) < INSERT_CHUNK_SIZE
+                return "insert_values" if small else "copy_csv"
+            if mode == "copy":
+                return "copy_csv"
+            if mode == "execute_values":
+                return "insert_values"
+        return "insert"
+
+    def _compile_preprocess(self) -> Callable[[dict], dict] | None:
+        """Generate a record preprocessor specialized to the stream schema.
+
+        Only the columns found by `_column_ops` are touched, so a record
+        never needs a property schema lookup for any of its values.
+
+        Returns:
+            A function that processes a record in place and returns it,
+            or None when no column of the stream needs processing.
+        """
+        source = ["def preprocess(record):"]
+        for key, (strip_nulls, decode_base64) in self._column_ops.items():
+            if decode_base64 and self._csv_decodes_base64:
+                # copy_csv writes these straight from base64 to bytea hex
+                continue
+            if decode_base64:
+                source += [
+                    f"    value = record.get({key!r})",
+                    "    if value is not None:",
+                    f"        record[{key!r}] = b64decode(value) if value else b''",
+                ]
+            elif strip_nulls:
+                source += [
+                    f"    value = record.get({key!r})",
+                    "    if type(value) is str and '\\x00' in value:",
+                    f"        record[{key!r}] = value.replace('\\x00', '')",
+                ]
+                source.append("        nulls_removed[0] += 1")
+        if len(source) == 1:
+            return None
+        source.append("    return record")
+
+        namespace: dict[str, Any] = {
+            "b64decode": b64decode,
+            "nulls_removed": self._nulls_removed,
+        }
+        exec("\n".join(source), namespace)  # noqa: S102
+        return namespace["preprocess"]
+
+    @property
+    def max_size(self) -> int:
+        """Get maximum batch size, as tuned when `autotune_batch_size` is on.
+
+        Returns:
+            Max number of records to batch before `is_full=True`
+        """
+        return self._tuned_max_size or super().max_size
+
+    def process_batch(self, context: dict) -> None:
+        """Process a batch, timing it to tune the batch size when enabled.
+
+        Load throughput rises with batch size up to a point and then
+        levels off or falls.  The fastest batch size and its rows per
+        second are kept.  While full batches improve on the best rate by
+        more than 5% the batch size is doubled, after that the best size
+        is restored and kept.
+
+        Args:
+            context: Stream partition or context dictionary.
+        """
+        if self._tuning_done or not self.config.get("autotune_batch_size", False):
+            super().process_batch(context)
+            return
+
+        batch_size = self.max_size
+        start = perf_counter()
+        super().process_batch(context)
+        elapsed = perf_counter() - start
+
+        rows = len(context.get("records", ()))
+        # Only full batches are comparable, a partial one is the tail
+        # of a stream or a time based drain
+        if rows < batch_size or elapsed <= 0:
+            return
+        rate = rows / elapsed
+        improved = rate > self._best_rate * 1.05
+        if rate > self._best_rate:
+            self._best_rate = rate
+            self._best_max_size = batch_size
+        if improved and batch_size < MAX_TUNED_BATCH_SIZE:
+            self._tuned_max_size = min(batch_size * 2, MAX_TUNED_BATCH_SIZE)
+        else:
+            self._tuned_max_size = self._best_max_size
+            self._tuning_done = True
+            self.logger.info("Batch size tuned to %d rows", self.max_size)
 
     def set_target_table(self, full_table_name: str) -> None:
         """Populates the property _target_table."""
-        # We need to grab the schema_name and table_name
-        # for the Table class instance
-        _, schema_name, table_name = SQLConnector.parse_full_table_name(self, full_table_name=full_table_name)
+        # The connector reflects each table once and
+        # shares the Table instance between sinks
+        self._target_table = self.connector.reflect_table(full_table_name)
+
+    def process_batch_files(
+        self,
+        encoding: BaseBatchFileEncoding,
+        files: Sequence[str],
+    ) -> None:
+        """Process a batch file with the given batch context.
 
-        # You also need a blank MetaData instance
-        # for the Table class instance
-        meta = MetaData()
+        JSONL files are read and loaded in chunks of `max_size` records,
+        so a large batch file is never held in memory all at once and the
+        database work starts before the whole file is parsed.  The next
+        chunk is parsed on a reader thread while the current one loads.
+        Other formats are left to the SDK.
 
-        # This is the Table instance that will autoload
-        # all the info about the table from the target server
-        table: Table = Table(table_name, meta, autoload_with=self.connector._engine, schema=schema_name)
+        Args:
+            encoding: The batch file encoding.
+            files: The batch files to process.
+        """
+        if encoding.format != BatchFileFormat.JSONL:
+            super().process_batch_files(encoding, files)
+            return
+
+        # Files that share a storage location are read through one
+        # filesystem session instead of connecting again for each file
+        for head, paths in groupby(
+            files, key=lambda path: StorageTarget.split_url(path)[0]
+        ):
+            storage = (
+                self.batch_config.storage
+                if self.batch_config
+                else StorageTarget.from_url(head)
+            )
+            with storage.fs(create=False) as batch_fs:
+                for path in paths:
+                    _, tail = StorageTarget.split_url(path)
+                    with batch_fs.open(tail, mode="rb") as file:
+                        self._process_jsonl_file(file, encoding)
+
+    def _process_jsonl_file(
+        self,
+        file: IO[bytes],
+        encoding: BaseBatchFileEncoding,
+    ) -> None:
+        """Load the records of one open JSONL batch file.
 
-        self._target_table = table
+        Args:
+            file: The open batch file.
+            encoding: The batch file encoding.
+        """
+        raw = io.BufferedReader(file, buffer_size=READ_BUFFER_SIZE)
+        context_file = (
+            GzipFile(fileobj=raw, mode="rb")
+            if encoding.compression == "gzip"
+            else raw
+        )
+        records = map(deserialize_json, iter_lines(context_file, READ_BUFFER_SIZE))
+
+        def read_chunk() -> list[dict]:
+            return list(islice(records, self.max_size))
+
+        # Parsing holds the GIL but loading mostly waits on the
+        # server, so the next chunk is read while this one loads
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            next_chunk = reader.submit(read_chunk)
+            while chunk := next_chunk.result():
+                next_chunk = reader.submit(read_chunk)
+                self.process_batch({"records": chunk})
 
     def bulk_insert_records(
         self,
@@ -404,22 +1374,439 @@ class PostgresSink(SQLSink):
         """
         if self.target_table is None:
             self.set_target_table(full_table_name)
+            if self.config.get("drop_indexes_during_load", False):
+                self.connector.drop_secondary_indexes(full_table_name)
+
+        # Records are conformed one at a time as they are written so
+        # a second copy of the whole batch is never held in memory.
+        conformed_records = (self.conform_record(record) for record in records)
+
+        # psycopg (3) copies in the binary format, psycopg2 copies CSV
+        # or sends multi row VALUES and everything else a SQLAlchemy insert
+        load_path = self._load_path(records)
+        # One connection is checked out for the batch and returned when
+        # it is loaded, the upsert staging steps must share its session
+        with self.connector._connect() as conn:  # noqa: SLF001
+            if self.config.get("load_method") == "upsert" and self.key_properties:
+                return self.upsert_records(conn, conformed_records, load_path)
+            if load_path == "copy_records":
+                return self.copy_records(conn, conformed_records)
+            if load_path == "copy_csv":
+                return self.copy_csv(conn, conformed_records)
+            if load_path == "insert_values":
+                return self.insert_values(conn, conformed_records)
+            return self._insert_records(conn, full_table_name, conformed_records)
+
+    def _insert_records(
+        self,
+        conn: sa.engine.Connection,
+        full_table_name: str,
+        records: Iterable[dict[str, Any]],
+    ) -> int:
+        """Insert conformed records with a SQLAlchemy executemany.
 
-        conformed_records = (
-            [self.conform_record(record) for record in records]
-            if isinstance(records, list)
-            else (self.conform_record(record) for record in records)
-        )
+        Args:
+            conn: The connection the batch is loaded on.
+            full_table_name: the target table name.
+            records: the conformed records.
 
+        Returns:
+            The number of rows inserted.
+        """
         # This is a insert based off SQLA example
         # https://docs.sqlalchemy.org/en/20/dialects/mssql.html#insert-behavior
+        # executemany needs a list so rows are sent in fixed size chunks
+        rowcount: int = 0
+        try:
+            with conn.begin():
+                insert_statement = self.connector.insert_statement(full_table_name)
+                while chunk := list(islice(records, INSERT_CHUNK_SIZE)):
+                    result:sa.CursorResult = conn.execute(insert_statement, chunk)
+                    rowcount += result.rowcount
+        except exc.SQLAlchemyError:
+            self.logger.exception("Unable to insert records into %s", self.stream_name)
+            raise
+
+        return rowcount
+
+    def copy_records(
+        self,
+        conn: sa.engine.Connection,
+        records: Iterable[dict[str, Any]],
+        table_name: str | None = None,
+    ) -> int:
+        """Load conformed records with `COPY ... FROM STDIN` using psycopg.
+
+        Rows are streamed in the binary COPY format which skips the SQL
+        parsing and per row parameter binding of an INSERT.  If any column
+        type has no binary adapter the text format is used instead.
+
+        Args:
+            conn: The connection the batch is loaded on.
+            records: the conformed records.
+            table_name: An already quoted table to copy into instead of
+                the target table.
+
+        Returns:
+            The number of rows copied.
+        """
+        column_names = [column.name for column in self.target_table.columns]
+        rowcount: int = 0
+        try:
+            with conn.begin():
+                copy_statement, copy_types, converters = self._copy_setup(
+                    conn.connection.driver_connection, table_name
+                )
+                cursor = conn.connection.cursor()
+                with cursor.copy(copy_statement) as copy:
+                    if copy_types:
+                        copy.set_types(copy_types)
+                    for record in records:
+                        row = [record.get(name) for name in column_names]
+                        for index, convert in converters:
+                            if row[index] is not None:
+                                row[index] = convert(row[index])
+                        copy.write_row(row)
+                        rowcount += 1
+        except Exception:
+            # A value no converter or dumper takes fails as a TypeError
+            self.logger.exception("Unable to copy records into %s", self.stream_name)
+            raise
+
+        return rowcount
+
+    def copy_csv(
+        self,
+        conn: sa.engine.Connection,
+        records: Iterable[dict[str, Any]],
+        table_name: str | None = None,
+    ) -> int:
+        """Load conformed records with `COPY ... FROM STDIN` using psycopg2.
+
+        psycopg2 has no row level COPY API, so the records are written
+        as CSV and streamed to `copy_expert` as it reads, keeping about
+        one read buffer of rows in memory.  When every batch is copied,
+        base64 columns are left encoded by `preprocess_record` and are
+        decoded straight to bytea hex.
+
+        Args:
+            conn: The connection the batch is loaded on.
+            records: the conformed records.
+            table_name: An already quoted table to copy into instead of
+                the target table.
+
+        Returns:
+            The number of rows copied.
+        """
+        import psycopg2
+        from psycopg2.extensions import encodings
+
+        encode_row = self._csv_row_encoder
+        copy_sql = (
+            f"COPY {self._quoted_table_columns(table_name)} FROM STDIN (FORMAT CSV)"
+        )
+
+        rowcount: int = 0
+
+        def lines() -> Iterator[str]:
+            nonlocal rowcount
+            for record in records:
+                rowcount += 1
+                yield encode_row(record)
+
+        try:
+            with conn.begin():
+                driver_connection = conn.connection.driver_connection
+                reader = _LineReader(lines(), encodings[driver_connection.encoding])
+                cursor = conn.connection.cursor()
+                cursor.copy_expert(copy_sql, reader, size=READ_BUFFER_SIZE)
+        except (exc.SQLAlchemyError, psycopg2.Error):
+            self.logger.exception("Unable to copy records into %s", self.stream_name)
+            raise
+
+        return rowcount
+
+    @cached_property
+    def _csv_row_encoder(self) -> Callable[[dict], str]:
+        """Generate a CSV line encoder specialized to the target table.
+
+        The column order and a field formatter picked from each column
+        type are written into the function, so encoding a record is one
+        call per column with no loop or type checks on the column list.
+
+        Returns:
+            A function that encodes a conformed record as a CSV line.
+        """
+        base64_columns = {
+            self._conformed_key_map.get(key, key)
+            for key, (_, decode_base64) in self._column_ops.items()
+            if decode_base64
+        }
+        namespace: dict[str, Any] = {}
+        fields = []
+        for index, column in enumerate(self.target_table.columns):
+            if column.name in base64_columns:
+                field = _csv_base64
+            elif isinstance(column.type, sa.types.JSON):
+                field = _csv_json
+            elif isinstance(column.type, sa.types.String):
+                field = _csv_text
+            elif isinstance(column.type, (sa.types.Integer, sa.types.Numeric)):
+                field = _csv_number
+            else:
+                field = _csv_value
+            namespace[f"field_{index}"] = field
+            fields.append(f"field_{index}(get({column.name!r}))")
+        source = [
+            "def encode_row(record):",
+            "    get = record.get",
+            f"    return ','.join(({', '.join(fields)},)) + '\\n'",
+        ]
+        exec("\n".join(source), namespace)  # noqa: S102
+        return namespace["encode_row"]
+
+    def upsert_records(
+        self,
+        conn: sa.engine.Connection,
+        records: Iterable[dict[str, Any]],
+        load_path: str,
+    ) -> int:
+        """Insert or update conformed records by the stream's key properties.
+
+        With a COPY load path the batch is copied into a temporary
+        staging table and merged with one `INSERT ... SELECT ... ON
+        CONFLICT DO UPDATE`, letting the server match the keys instead
+        of handling each row.  Other load paths send the upsert as a
+        SQLAlchemy insert.
+
+        Args:
+            conn: The connection the batch is loaded on.
+            records: the conformed records.
+            load_path: How the batch would be loaded, from `_load_path`.
+
+        Returns:
+            The number of rows copied or inserted.
+        """
+        preparer = self.connector._engine.dialect.identifier_preparer  # noqa: SLF001
+        target = preparer.format_table(self.target_table)
+        columns = [column.name for column in self.target_table.columns]
+        keys = [self._conformed_key_map.get(key, key) for key in self.key_properties]
+        updates = [name for name in columns if name not in keys]
+
+        if load_path not in {"copy_records", "copy_csv"}:
+            insert = self.connector.upsert_statement(self.full_table_name, keys)
+            # ON CONFLICT DO UPDATE can not change a row twice in one
+            # statement, the last copy of a key wins as with DISTINCT ON
+            rows = iter(_last_record_per_key(records, keys))
+            rowcount: int = 0
+            try:
+                with conn.begin():
+                    while chunk := list(islice(rows, INSERT_CHUNK_SIZE)):
+                        rowcount += conn.execute(insert, chunk).rowcount
+            except exc.SQLAlchemyError:
+                self.logger.exception(
+                    "Unable to upsert records into %s", self.stream_name
+                )
+                raise
+            return rowcount
+
+        # The staging table lives in this session's pg_temp schema, it is
+        # made fresh for each batch so it always matches the target table
+        staging = preparer.quote(f"stage_{self.target_table.name}")
+        with conn.begin():
+            conn.execute(sa.text(f"DROP TABLE IF EXISTS pg_temp.{staging}"))
+            conn.execute(
+                sa.text(f"CREATE TEMP TABLE {staging} (LIKE {target} INCLUDING DEFAULTS)")
+            )
+
+        if load_path == "copy_records":
+            rowcount = self.copy_records(conn, records, staging)
+        else:
+            rowcount = self.copy_csv(conn, records, staging)
+        if not rowcount:
+            return rowcount
+
+        column_list = ", ".join(preparer.quote(name) for name in columns)
+        key_list = ", ".join(preparer.quote(name) for name in keys)
+        conflict = "DO NOTHING"
+        if updates:
+            quoted = [preparer.quote(name) for name in updates]
+            set_list = ", ".join(f"{name} = EXCLUDED.{name}" for name in quoted)
+            conflict = f"DO UPDATE SET {set_list}"
+            # Skip rewriting rows that did not change, json has no
+            # equality operator so tables with it always update
+            if not any(
+                isinstance(column.type, sa.types.JSON)
+                and not isinstance(column.type, postgresql.JSONB)
+                for column in self.target_table.columns
+            ):
+                current = ", ".join(f"target.{name}" for name in quoted)
+                excluded = ", ".join(f"EXCLUDED.{name}" for name in quoted)
+                conflict += f" WHERE ({current}) IS DISTINCT FROM ({excluded})"
+        # A key repeated in the batch can only be applied once, the last
+        # copy of it wins as it would with one insert after another
+        merge_sql = (
+            f"INSERT INTO {target} AS target ({column_list}) "
+            f"SELECT DISTINCT ON ({key_list}) {column_list} FROM {staging} "
+            f"ORDER BY {key_list}, ctid DESC "
+            f"ON CONFLICT ({key_list}) {conflict}"
+        )
+        try:
+            with conn.begin():
+                conn.execute(sa.text(merge_sql))
+                conn.execute(sa.text(f"DROP TABLE {staging}"))
+        except exc.SQLAlchemyError:
+            self.logger.exception("Unable to merge records into %s", self.stream_name)
+            raise
+        return rowcount
+
+    def insert_values(
+        self,
+        conn: sa.engine.Connection,
+        records: Iterable[dict[str, Any]],
+    ) -> int:
+        """Insert conformed records with psycopg2's `execute_values`.
+
+        Each page of INSERT_CHUNK_SIZE rows is sent as a single
+        `INSERT ... VALUES (...), (...)` statement, which skips the
+        per row parameter handling of SQLAlchemy's executemany.
+
+        Args:
+            conn: The connection the batch is loaded on.
+            records: the conformed records.
+
+        Returns:
+            The number of rows inserted.
+        """
+        import psycopg2
+        from psycopg2.extras import Json as Psycopg2Json
+        from psycopg2.extras import execute_values
+
+        columns = list(self.target_table.columns)
+        column_names = [column.name for column in columns]
+        json_indexes = [
+            index
+            for index, column in enumerate(columns)
+            if isinstance(column.type, sa.types.JSON)
+        ]
+        insert_sql = f"INSERT INTO {self._quoted_table_columns()} VALUES %s"
+
         rowcount: int = 0
+
+        def rows() -> Iterator[list]:
+            nonlocal rowcount
+            for record in records:
+                row = [record.get(name) for name in column_names]
+                for index in json_indexes:
+                    if row[index] is not None:
+                        row[index] = Psycopg2Json(row[index], dumps=serialize_json)
+                rowcount += 1
+                yield row
+
         try:
-            with self.connector._connect() as conn, conn.begin():  # noqa: SLF001
-                result:sa.CursorResult = conn.execute(self.target_table.insert(), conformed_records)
-            rowcount = result.rowcount
-        except exc.SQLAlchemyError as e:
-            error = str(e.__dict__["orig"])
-            self.logger.info(error)
+            with conn.begin():
+                cursor = conn.connection.cursor()
+                execute_values(cursor, insert_sql, rows(), page_size=INSERT_CHUNK_SIZE)
+        except (exc.SQLAlchemyError, psycopg2.Error):
+            self.logger.exception("Unable to insert records into %s", self.stream_name)
+            raise
 
         return rowcount
+
+    def clean_up(self) -> None:
+        """Log the null characters removed and rebuild dropped indexes."""
+        if self._nulls_removed[0] and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Removed Null Character(s) From %d value(s)", self._nulls_removed[0]
+            )
+        if self.config.get("drop_indexes_during_load", False):
+            self.connector.recreate_indexes(self.full_table_name)
+        super().clean_up()
+
+    def _quoted_table_columns(self, table_name: str | None = None) -> str:
+        """Return the quoted target table followed by its quoted column list.
+
+        Args:
+            table_name: An already quoted table to use instead of the target.
+
+        Returns:
+            The table and column list, `"schema"."table" ("a", "b")`.
+        """
+        preparer = self.connector._engine.dialect.identifier_preparer  # noqa: SLF001
+        column_list = ", ".join(
+            preparer.quote(column.name) for column in self.target_table.columns
+        )
+        table_name = table_name or preparer.format_table(self.target_table)
+        return f"{table_name} ({column_list})"
+
+    def _copy_setup(
+        self,
+        connection: psycopg.Connection,
+        table_name: str | None = None,
+    ) -> tuple[str, list[int], list[tuple[int, Callable[[Any], Any]]]]:
+        """Build the COPY statement, column types and value converters.
+
+        Args:
+            connection: the psycopg connection the COPY will run on.
+            table_name: An already quoted table to copy into instead of
+                the target table.
+
+        Returns:
+            The COPY statement, the column type oids for a binary COPY
+            (empty for a text COPY) and (column index, converter) pairs.
+        """
+        dialect = self.connector._engine.dialect  # noqa: SLF001
+        columns = list(self.target_table.columns)
+
+        copy_types: list[int] = []
+        for column in columns:
+            type_name = TYPE_MODIFIERS.sub("", column.type.compile(dialect=dialect))
+            type_name = type_name.lower()
+            try:
+                oid = connection.adapters.types.get_oid(
+                    TYPE_ALIASES.get(type_name, type_name)
+                )
+                connection.adapters.get_dumper_by_oid(oid, pq.Format.BINARY)
+            except (KeyError, psycopg.ProgrammingError):
+                copy_types = []
+                break
+            copy_types.append(oid)
+
+        # Binary dumpers are picked by column type so every value has
+        # to become the python type the dumper takes, where an INSERT
+        # would have let the server cast it.
+        # A text COPY lets the server parse those strings itself.
+        converters: list[tuple[int, Callable[[Any], Any]]] = []
+        for index, column in enumerate(columns):
+            column_type = column.type
+            if isinstance(column_type, postgresql.JSONB):
+                converters.append((index, _copy_jsonb))
+            elif isinstance(column_type, sa.types.JSON):
+                converters.append((index, _copy_json))
+            elif not copy_types:
+                continue
+            elif isinstance(column_type, sa.types.DateTime):
+                if column_type.timezone:
+                    converters.append((index, _copy_datetime))
+                else:
+                    converters.append((index, _copy_naive_datetime))
+            elif isinstance(column_type, sa.types.Date):
+                converters.append((index, _copy_date))
+            elif isinstance(column_type, sa.types.Time):
+                converters.append((index, _copy_time))
+            elif isinstance(column_type, sa.types.Uuid):
+                converters.append((index, _copy_uuid))
+            elif isinstance(column_type, sa.types.String):
+                converters.append((index, _copy_text))
+            elif isinstance(column_type, sa.types.Integer):
+                converters.append((index, _copy_integer))
+            elif isinstance(column_type, sa.types.Float):
+                converters.append((index, _copy_float))
+            elif isinstance(column_type, sa.types.Numeric):
+                converters.append((index, _copy_numeric))
+
+        copy_format = "BINARY" if copy_types else "TEXT"
+        copy_statement = (
+            f"COPY {self._quoted_table_columns(table_name)} FROM STDIN (FORMAT {copy_format})"  # noqa: E501
+        )
+        return copy_statement, copy_types, converters
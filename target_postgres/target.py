@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import json
+import sys
+from typing import IO, TYPE_CHECKING
+
 from singer_sdk import typing as th
+from singer_sdk.exceptions import InvalidInputLine
 from singer_sdk.target_base import SQLTarget
 
+from target_postgres.json import deserialize_json, iter_lines
 from target_postgres.sinks import PostgresSink
 
+if TYPE_CHECKING:
+    from pathlib import PurePath
+
+# Only the start of a line that fails to parse is logged, a malformed
+# line can be megabytes long.
+MAX_LOGGED_LINE_LENGTH = 512
+
 
 class Targetpostgres(SQLTarget):
     """Sample target for postgres."""
@@ -72,17 +85,22 @@ class Targetpostgres(SQLTarget):
                 th.Property(
                     "executemany_mode",
                     th.StringType,
-                    description="Executemany Mode: values_plus_batch,"
+                    description="Executemany Mode: values_plus_batch, psycopg2 only, defaults to values_plus_batch"  # noqa: E501
                 ),
                 th.Property(
                     "executemany_values_page_size",
                     th.IntegerType,
                     description="Executemany Values Page Size: Number:,"
                 ),
+                th.Property(
+                    "insertmanyvalues_page_size",
+                    th.IntegerType,
+                    description="Rows per multi row INSERT: Number:, defaults to 1000 with psycopg2"  # noqa: E501
+                ),
                 th.Property(
                     "executemany_batch_page_size",
                     th.IntegerType,
-                    description="Executemany Batch Page Size: Number:,"
+                    description="Executemany Batch Page Size: Number:, psycopg2 only, defaults to 500"  # noqa: E501
                 ),
                 th.Property(
                     "future",
@@ -138,8 +156,109 @@ class Targetpostgres(SQLTarget):
             default=False,
             description="Turn on translation of Higher Defined(HD) JSON Schema types to SQL Types."  # noqa: E501
         ),
+        th.Property(
+            "bulk_load_mode",
+            th.StringType,
+            allowed_values=["auto", "copy", "execute_values", "insert"],
+            default="auto",
+            description=(
+                "How batches are loaded: auto, copy, execute_values or insert. "
+                "COPY is limited by bandwidth while INSERTs are limited by round "
+                "trips, auto uses COPY except for small psycopg2 batches"
+            )
+        ),
+        th.Property(
+            "autotune_batch_size",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Double the batch size while the rows per second loaded keep "
+                "improving, starting from batch_size_rows"
+            )
+        ),
+        th.Property(
+            "drop_indexes_during_load",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Drop non unique indexes of a table before loading a stream "
+                "and build them again once the stream is done"
+            )
+        ),
+        th.Property(
+            "max_parallelism",
+            th.IntegerType,
+            description=(
+                "How many sinks are drained at the same time, each on its own "
+                "connection. Defaults to 8"
+            )
+        ),
     ).to_dict()
 
+    def __init__(
+        self,
+        *,
+        config: dict | PurePath | str | list[PurePath | str] | None = None,
+        parse_env_config: bool = False,
+        validate_config: bool = True,
+        setup_mapper: bool = True,
+    ) -> None:
+        """Initialize the target, taking max parallelism from the config.
+
+        Args:
+            config: Target configuration. Can be a dictionary, a single path to a
+                configuration file, or a list of paths to multiple configuration
+                files.
+            parse_env_config: Whether to look for configuration values in environment
+                variables.
+            validate_config: True to require validation of config settings.
+            setup_mapper: True to setup the mapper.
+        """
+        super().__init__(
+            config=config,
+            parse_env_config=parse_env_config,
+            validate_config=validate_config,
+            setup_mapper=setup_mapper,
+        )
+        if self.config.get("max_parallelism"):
+            self.max_parallelism = self.config["max_parallelism"]
+
+    @property
+    def default_input(self) -> IO[str]:
+        """Return the lines of standard input, read as bytes in large blocks.
+
+        Each block is split into lines in one call, msgspec decodes the
+        bytes directly so no line is ever decoded to a str.
+
+        Returns:
+            An iterator over the lines of standard input.
+        """
+        return iter_lines(sys.stdin.buffer)  # type: ignore[return-value]
+
+    def deserialize_json(self, line: str | bytes) -> dict:
+        """Deserialize a line of json.
+
+        Uses the msgspec decoder, Singer messages are still returned
+        as plain dictionaries since that is what the SDK works with.
+
+        Args:
+            line: A single line of json, as a str or bytes.
+
+        Returns:
+            A dictionary of the deserialized json.
+
+        Raises:
+            InvalidInputLine: raised if any lines are not valid json
+        """
+        try:
+            return deserialize_json(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            self.logger.exception(
+                "Unable to parse:\n%s", line[:MAX_LOGGED_LINE_LENGTH]
+            )
+            msg = f"Unable to parse line as JSON: {line[:MAX_LOGGED_LINE_LENGTH]!r}"
+            raise InvalidInputLine(msg) from exc
+
 
 if __name__ == "__main__":
     Targetpostgres.cli()
@@ -0,0 +1,48 @@
+"""Tests for the JSON helpers."""
+
+from __future__ import annotations
+
+import io
+from decimal import Decimal
+
+import pytest
+
+from target_postgres.json import deserialize_json, iter_lines, serialize_json
+
+
+def test_serialize_json_strips_null_characters() -> None:
+    """NUL characters are removed from encoded strings."""
+    assert serialize_json({"a": "x\x00y", "b": ["\x00"]}) == '{"a":"xy","b":[""]}'
+
+
+def test_serialize_json_keeps_escaped_backslash() -> None:
+    """The literal text \\u0000 is not a NUL character and is kept."""
+    value = {"a": "\\u0000", "b": "\\\x00"}
+    assert deserialize_json(serialize_json(value)) == {"a": "\\u0000", "b": "\\"}
+
+
+def test_deserialize_json_decimals() -> None:
+    """Numbers with a fraction are decoded as Decimal, integers as int."""
+    assert deserialize_json(b'{"a": 1.10, "b": 2}') == {"a": Decimal("1.10"), "b": 2}
+
+
+def test_deserialize_json_non_finite_floats() -> None:
+    """NaN and Infinity written by json.dumps are still accepted."""
+    value = deserialize_json('{"a": NaN, "b": Infinity, "c": 0.5}')
+    assert value["a"] != value["a"]
+    assert value["b"] == float("inf")
+    assert value["c"] == Decimal("0.5")
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 64])
+def test_iter_lines(size: int) -> None:
+    """Lines are split across block boundaries and empty lines dropped."""
+    data = b'{"a": 1}\n\n{"b": 22}\r\nlong' + b"x" * 100 + b"\nlast"
+    lines = list(iter_lines(io.BytesIO(data), size))
+    assert lines == [b'{"a": 1}', b'{"b": 22}\r', b"long" + b"x" * 100, b"last"]
+
+
+def test_iter_lines_empty() -> None:
+    """An empty stream or one with only newlines yields nothing."""
+    assert list(iter_lines(io.BytesIO(b""))) == []
+    assert list(iter_lines(io.BytesIO(b"\n\n\n"), 2)) == []
@@ -0,0 +1,511 @@
+"""Tests for the sink helpers that do not need a database."""
+
+from __future__ import annotations
+
+import atexit
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import IO, Any, Callable, Iterator
+
+import pytest
+import sqlalchemy as sa
+from psycopg import postgres, pq
+from singer_sdk.connectors import SQLConnector
+from singer_sdk.exceptions import ConformedNameClashException
+from singer_sdk.sinks import SQLSink
+from sqlalchemy.dialects import postgresql
+
+from target_postgres import sinks
+from target_postgres.sinks import (
+    PostgresConnector,
+    PostgresSink,
+    _LineReader,
+    _copy_datetime,
+    _copy_float,
+    _copy_integer,
+    _copy_naive_datetime,
+    _copy_numeric,
+    _copy_text,
+    _last_record_per_key,
+    concurrent_index_definition,
+)
+from target_postgres.target import Targetpostgres
+
+
+def test_copy_datetime_accepts_trailing_z() -> None:
+    """A Singer timestamp ending in Z parses as UTC."""
+    value = _copy_datetime("2023-01-02T03:04:05Z")
+    assert value.utcoffset().total_seconds() == 0
+    assert value.replace(tzinfo=None) == datetime(2023, 1, 2, 3, 4, 5)  # noqa: DTZ001
+
+
+def test_copy_naive_datetime_converts_to_utc() -> None:
+    """Aware values for a timestamp column become naive UTC datetimes."""
+    assert _copy_naive_datetime("2023-01-02T03:04:05Z") == datetime(2023, 1, 2, 3, 4, 5)  # noqa: DTZ001, E501
+    assert _copy_naive_datetime("2023-01-02T03:04:05+02:00") == datetime(  # noqa: DTZ001
+        2023, 1, 2, 1, 4, 5
+    )
+    naive = datetime(2023, 1, 2, 3, 4, 5)  # noqa: DTZ001
+    assert _copy_naive_datetime(naive) is naive
+
+
+def test_timestamp_binary_dumper_takes_copy_value() -> None:
+    """A Z timestamp is dumped by the binary COPY dumper of a timestamp column."""
+    dumper_class = postgres.adapters.get_dumper_by_oid(
+        postgres.types["timestamp"].oid, pq.Format.BINARY
+    )
+    dumper = dumper_class(datetime)
+    with pytest.raises(TypeError):
+        dumper.dump(_copy_datetime("2023-01-02T03:04:05Z"))
+    assert dumper.dump(_copy_naive_datetime("2023-01-02T03:04:05Z")) == dumper.dump(
+        datetime(2023, 1, 2, 3, 4, 5)  # noqa: DTZ001
+    )
+
+
+
+def binary_dump(type_name: str, value: Any) -> bytes:  # noqa: ANN401
+    """Dump a value with the binary COPY dumper of a postgres type."""
+    dumper_class = postgres.adapters.get_dumper_by_oid(
+        postgres.types[type_name].oid, pq.Format.BINARY
+    )
+    return dumper_class(type(value)).dump(value)
+
+
+@pytest.mark.parametrize(
+    ("type_name", "convert", "value", "expected"),
+    [
+        ("varchar", _copy_text, 12, "12"),
+        ("varchar", _copy_text, Decimal("1.50"), "1.50"),
+        ("varchar", _copy_text, True, "true"),
+        ("text", _copy_text, {"a": [1]}, '{"a":[1]}'),
+        ("int8", _copy_integer, Decimal("1"), 1),
+        ("int8", _copy_integer, 1.0, 1),
+        ("int8", _copy_integer, Decimal("2.5"), 3),
+        ("int4", _copy_integer, "7", 7),
+        ("numeric", _copy_numeric, 1.1, Decimal("1.1")),
+        ("numeric", _copy_numeric, "2.25", Decimal("2.25")),
+        ("numeric", _copy_numeric, float("inf"), Decimal("Infinity")),
+        ("float8", _copy_float, "0.5", 0.5),
+        ("float8", _copy_float, Decimal("0.5"), Decimal("0.5")),
+    ],
+)
+def test_copy_converters(
+    type_name: str,
+    convert: Callable[[Any], Any],
+    value: Any,  # noqa: ANN401
+    expected: Any,  # noqa: ANN401
+) -> None:
+    """Values an INSERT would cast become types the binary dumpers take."""
+    converted = convert(value)
+    assert converted == expected
+    assert binary_dump(type_name, converted) == binary_dump(type_name, expected)
+
+
+def test_copy_numeric_nan() -> None:
+    """A NaN float is kept as a numeric NaN."""
+    assert _copy_numeric(float("nan")).is_nan()
+    assert binary_dump("numeric", _copy_numeric(float("nan")))
+
+
+SCHEMA: dict = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": ["string", "null"]},
+        "blob": {"type": ["string", "null"], "contentEncoding": "base64"},
+        "doc": {"type": ["object", "null"]},
+    },
+}
+
+
+def make_sink(**config: Any) -> PostgresSink:
+    """Build a sink without connecting to a database."""
+    target = Targetpostgres(
+        config={
+            "host": "localhost",
+            "user": "user",
+            "password": "password",
+            "database": "database",
+            **config,
+        },
+    )
+    return PostgresSink(
+        target=target, stream_name="things", schema=SCHEMA, key_properties=["id"]
+    )
+
+
+def test_preprocess_record() -> None:
+    """Null characters are stripped and base64 is decoded."""
+    sink = make_sink()
+    record = {"id": 1, "name": "a\x00b", "blob": "aGk=", "doc": {"a": "\x00"}}
+    assert sink.preprocess_record(record, {}) == {
+        "id": 1,
+        "name": "ab",
+        "blob": b"hi",
+        "doc": {"a": "\x00"},
+    }
+    assert sink._nulls_removed == [1]  # noqa: SLF001
+    record = {"id": 2, "name": None, "blob": ""}
+    assert sink.preprocess_record(record, {}) == {"id": 2, "name": None, "blob": b""}
+    assert sink._nulls_removed == [1]  # noqa: SLF001
+
+
+def test_preprocess_record_without_string_columns() -> None:
+    """A stream with nothing to preprocess returns records unchanged."""
+    sink = make_sink()
+    sink.schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    record = {"id": 1}
+    assert sink.preprocess_record(record, {}) is record
+
+
+def test_csv_row_encoder() -> None:
+    """Each column is written with the CSV format of its type."""
+    sink = make_sink(driver_type="psycopg2", bulk_load_mode="copy")
+    sink._target_table = sa.Table(  # noqa: SLF001
+        "things",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer),
+        sa.Column("name", sa.String),
+        sa.Column("blob", postgresql.BYTEA),
+        sa.Column("doc", postgresql.JSONB),
+        sa.Column("flag", sa.Boolean),
+    )
+    encode_row = sink._csv_row_encoder  # noqa: SLF001
+    assert encode_row(
+        {"id": 1, "name": 'say "hi"', "blob": "aGk=", "doc": "[1,2]", "flag": True}
+    ) == '1,"say ""hi""",\\x6869,"""[1,2]""",true\n'
+    assert encode_row({"id": 2, "name": "", "doc": {"a": [1]}}) == (
+        '2,"",,"{""a"":[1]}",\n'
+    )
+
+
+def test_last_record_per_key() -> None:
+    """The last record of a repeated key wins, in first seen key order."""
+    records = [
+        {"id": 1, "v": "a"},
+        {"id": 2, "v": "b"},
+        {"id": 1, "v": "c"},
+    ]
+    assert _last_record_per_key(records, ["id"]) == [
+        {"id": 1, "v": "c"},
+        {"id": 2, "v": "b"},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("jsonschema_type", "expected"),
+    [
+        ({"type": ["integer"], "maximum": 99999}, "NUMERIC(5, 0)"),
+        ({"type": ["integer"]}, "NUMERIC"),
+        (
+            {"type": ["integer"], "minimum": -2147483648, "maximum": 2147483647},
+            "INTEGER",
+        ),
+        ({"type": ["number"], "maximum": Decimal("99999.999")}, "NUMERIC(8, 3)"),
+        ({"type": ["number"], "maximum": 12.5}, "NUMERIC(3, 1)"),
+        ({"type": ["number"], "maximum": Decimal("1E+5")}, "NUMERIC(5, 0)"),
+        (
+            {
+                "type": ["number"],
+                "minimum": Decimal("-214748.3648"),
+                "maximum": Decimal("214748.3647"),
+            },
+            "MONEY",
+        ),
+    ],
+)
+def test_hd_numeric_types(jsonschema_type: dict, expected: str) -> None:
+    """NUMERIC precision and scale come from the schema maximum."""
+    sql_type = PostgresConnector.hd_to_sql_type(jsonschema_type)
+    assert str(sql_type.compile(dialect=postgresql.dialect())) == expected
+
+
+def test_copy_setup_converters() -> None:
+    """Every binary COPY column type gets the converter its dumper needs."""
+    sink = make_sink()
+    sink._target_table = sa.Table(  # noqa: SLF001
+        "things",
+        sa.MetaData(),
+        sa.Column("id", sa.BigInteger),
+        sa.Column("name", sa.String),
+        sa.Column("amount", sa.DECIMAL(10, 2)),
+        sa.Column("ratio", sa.Float),
+        sa.Column("seen", sa.TIMESTAMP),
+        sa.Column("flag", sa.Boolean),
+    )
+    statement, copy_types, converters = sink._copy_setup(  # noqa: SLF001
+        SimpleNamespace(adapters=postgres.adapters)
+    )
+    assert statement.endswith("(FORMAT BINARY)")
+    assert len(copy_types) == 6  # noqa: PLR2004
+    assert converters == [
+        (0, _copy_integer),
+        (1, _copy_text),
+        (2, _copy_numeric),
+        (3, _copy_float),
+        (4, _copy_naive_datetime),
+    ]
+
+
+class RecordingConnection:
+    """A connection that records the SQL run on it."""
+
+    def __init__(self, statements: list[str], rows: list[tuple]) -> None:
+        """Record into statements, and answer every query with rows."""
+        self.statements = statements
+        self.rows = rows
+
+    def __enter__(self) -> RecordingConnection:
+        """Open the connection."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the connection."""
+
+    def begin(self) -> RecordingConnection:
+        """Start a transaction."""
+        return self
+
+    def execution_options(self, **options: Any) -> RecordingConnection:  # noqa: ARG002
+        """Set execution options."""
+        return self
+
+    def execute(self, statement: Any, parameters: Any = None) -> Any:  # noqa: ANN401, ARG002
+        """Record a statement."""
+        self.statements.append(str(statement).strip())
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+class RecordingEngine:
+    """An engine whose connections record the SQL run on them."""
+
+    dialect = postgresql.psycopg.dialect()
+
+    def __init__(self, rows: list[tuple]) -> None:
+        """Answer every query with rows."""
+        self.statements: list[str] = []
+        self.rows = rows
+
+    def connect(self) -> RecordingConnection:
+        """Open a connection."""
+        return RecordingConnection(self.statements, self.rows)
+
+
+def test_concurrent_index_definition() -> None:
+    """Dropped indexes are built again concurrently."""
+    assert concurrent_index_definition(
+        "CREATE INDEX things_name_idx ON public.things USING btree (name)"
+    ) == (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS things_name_idx "
+        "ON public.things USING btree (name)"
+    )
+
+
+def test_dropped_indexes_tracked_per_table() -> None:
+    """A later sink of the table rebuilds indexes an earlier sink dropped."""
+    connector = make_sink().connector
+    definition = "CREATE INDEX things_name_idx ON public.things USING btree (name)"
+    engine = RecordingEngine([("public.things_name_idx", definition)])
+    connector._cached_engine = engine  # noqa: SLF001
+    connector._reflected_tables[("public", "things")] = sa.Table(  # noqa: SLF001
+        "things", connector._reflected_metadata, schema="public"  # noqa: SLF001
+    )
+    try:
+        connector.drop_secondary_indexes("public.things")
+        assert engine.statements[-1] == "DROP INDEX public.things_name_idx"
+
+        # The sink that replaces it after a schema change finds nothing to drop
+        engine.rows = []
+        connector.drop_secondary_indexes("public.things")
+        assert connector._dropped_indexes == {  # noqa: SLF001
+            ("public", "things"): [definition]
+        }
+
+        connector.recreate_indexes("public.things")
+        assert engine.statements[-1] == concurrent_index_definition(definition)
+        assert connector._dropped_indexes == {}  # noqa: SLF001
+    finally:
+        atexit.unregister(connector.recreate_all_indexes)
+
+
+def test_adapt_column_type_forgets_only_altered_tables(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The cached table is kept when adapting a column alters nothing."""
+    connector = make_sink().connector
+    column_types = {"name": sa.VARCHAR()}
+    monkeypatch.setattr(
+        connector, "_get_column_type", lambda _, column: column_types[column]
+    )
+
+    def adapt(_: Any, __: str, column: str, sql_type: sa.types.TypeEngine) -> None:  # noqa: ANN401
+        column_types[column] = sql_type
+
+    monkeypatch.setattr(SQLConnector, "_adapt_column_type", adapt)
+    table = sa.Table("things", connector._reflected_metadata, schema="public")  # noqa: SLF001
+    connector._reflected_tables[("public", "things")] = table  # noqa: SLF001
+
+    connector._adapt_column_type("public.things", "name", sa.VARCHAR())  # noqa: SLF001
+    assert ("public", "things") in connector._reflected_tables  # noqa: SLF001
+
+    connector._adapt_column_type("public.things", "name", sa.TEXT())  # noqa: SLF001
+    assert ("public", "things") not in connector._reflected_tables  # noqa: SLF001
+
+
+def test_conform_record_rejects_clashing_names() -> None:
+    """Properties that conform to the same column name are an error."""
+    sink = make_sink()
+    assert sink.conform_record({"id": 1, "Extra": 2}) == {"id": 1, "extra": 2}
+    with pytest.raises(ConformedNameClashException):
+        sink.conform_record({"id": 1, "Extra": 2, "extra": 3})
+
+
+def things_table(sink: PostgresSink, *columns: sa.Column) -> sa.Table:
+    """Give the sink's connector a reflected `things` table."""
+    connector = sink.connector
+    table = sa.Table(
+        "things",
+        connector._reflected_metadata,  # noqa: SLF001
+        sa.Column("id", sa.Integer, primary_key=True),
+        *columns,
+    )
+    connector._reflected_tables[(None, "things")] = table  # noqa: SLF001
+    sink._target_table = table  # noqa: SLF001
+    return table
+
+
+def test_upsert_statement_skips_unchanged_rows() -> None:
+    """The SQLAlchemy upsert only rewrites rows whose values changed."""
+    sink = make_sink()
+    things_table(sink, sa.Column("name", sa.String), sa.Column("n", sa.Integer))
+    statement = sink.connector.upsert_statement("things", ["id"])
+    assert str(statement.compile(dialect=postgresql.psycopg.dialect())).endswith(
+        "ON CONFLICT (id) DO UPDATE SET name = excluded.name, n = excluded.n "
+        "WHERE (things.name, things.n) IS DISTINCT FROM (excluded.name, excluded.n)"
+    )
+
+
+def test_upsert_statement_with_json_always_updates() -> None:
+    """json has no equality operator, so its tables update every conflict."""
+    sink = make_sink()
+    things_table(sink, sa.Column("doc", postgresql.JSON))
+    statement = sink.connector.upsert_statement("things", ["id"])
+    assert str(statement.compile(dialect=postgresql.psycopg.dialect())).endswith(
+        "ON CONFLICT (id) DO UPDATE SET doc = excluded.doc"
+    )
+
+
+def test_upsert_records_merges_staging_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A copied batch is merged from its staging table, last key wins."""
+    sink = make_sink()
+    things_table(sink, sa.Column("name", sa.String))
+    engine = RecordingEngine([])
+    sink.connector._cached_engine = engine  # noqa: SLF001
+    copied = []
+    monkeypatch.setattr(
+        sink,
+        "copy_records",
+        lambda _, records, table_name: copied.append(table_name) or len(list(records)),
+    )
+
+    rowcount = sink.upsert_records(
+        engine.connect(), iter([{"id": 1}, {"id": 1}]), "copy_records"
+    )
+    assert rowcount == 2  # noqa: PLR2004
+    assert copied == ["stage_things"]
+    assert engine.statements == [
+        "DROP TABLE IF EXISTS pg_temp.stage_things",
+        "CREATE TEMP TABLE stage_things (LIKE things INCLUDING DEFAULTS)",
+        "INSERT INTO things AS target (id, name) "
+        "SELECT DISTINCT ON (id) id, name FROM stage_things "
+        "ORDER BY id, ctid DESC "
+        "ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name "
+        "WHERE (target.name) IS DISTINCT FROM (EXCLUDED.name)",
+        "DROP TABLE stage_things",
+    ]
+
+
+def test_to_sql_type_returns_a_new_instance() -> None:
+    """Cached types are built again so callers can change their own copy."""
+    connector = make_sink().connector
+    jsonschema_type = {"type": ["string"], "maxLength": 20}
+    first = connector.to_sql_type(jsonschema_type)
+    first.collation = "C"
+    second = connector.to_sql_type(jsonschema_type)
+    assert second is not first
+    assert type(second) is type(first)
+    assert second.length == 20  # noqa: PLR2004
+    assert second.collation is None
+
+
+def test_autotune_restores_the_fastest_batch_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Batches double while they get faster, then the fastest size is kept."""
+    sink = make_sink(autotune_batch_size=True)
+    monkeypatch.setattr(SQLSink, "process_batch", lambda _, __: None)
+    # Rows per second of each batch: 10k, 20k, then 10k again
+    clock = iter([0.0, 1.0, 1.0, 2.0, 2.0, 6.0])
+    monkeypatch.setattr(sinks, "perf_counter", lambda: next(clock))
+
+    sizes = []
+    for _ in range(3):
+        sizes.append(sink.max_size)
+        sink.process_batch({"records": range(sink.max_size)})
+    assert sizes == [10_000, 20_000, 40_000]
+    assert sink.max_size == 20_000  # noqa: PLR2004
+
+    # Tuning is over, later batches are not timed
+    sink.process_batch({"records": range(sink.max_size)})
+    assert sink.max_size == 20_000  # noqa: PLR2004
+
+
+def test_line_reader_encodes_lines_as_read() -> None:
+    """Lines are only encoded when a read needs more bytes."""
+    produced = []
+
+    def lines() -> Iterator[str]:
+        for line in ("ab\n", "cd\n", "é\n"):
+            produced.append(line)
+            yield line
+
+    reader = _LineReader(lines(), "latin-1")
+    assert reader.read(2) == b"ab"
+    assert produced == ["ab\n"]
+    assert reader.read(4) == b"\ncd\n"
+    assert reader.read() == b"\xe9\n"
+    assert reader.read(1) == b""
+
+
+class CopyCursor:
+    """A psycopg2 cursor that reads what copy_expert is given."""
+
+    def __init__(self) -> None:
+        """Start with nothing copied."""
+        self.sql = ""
+        self.data = b""
+
+    def copy_expert(self, sql: str, file: IO[bytes], size: int) -> None:
+        """Read the whole file in blocks of size."""
+        self.sql = sql
+        while block := file.read(size):
+            self.data += block
+
+
+def test_copy_csv_streams_rows() -> None:
+    """copy_csv streams every record to COPY as CSV and counts them."""
+    sink = make_sink(driver_type="psycopg2", bulk_load_mode="copy")
+    things_table(sink, sa.Column("name", sa.String))
+    sink.connector._cached_engine = RecordingEngine([])  # noqa: SLF001
+    cursor = CopyCursor()
+    conn = RecordingConnection([], [])
+    conn.connection = SimpleNamespace(
+        driver_connection=SimpleNamespace(encoding="UTF8"),
+        cursor=lambda: cursor,
+    )
+
+    rowcount = sink.copy_csv(conn, iter([{"id": 1, "name": "a"}, {"id": 2}]))
+    assert rowcount == 2  # noqa: PLR2004
+    assert cursor.sql == "COPY things (id, name) FROM STDIN (FORMAT CSV)"
+    assert cursor.data == b'1,"a"\n2,\n'
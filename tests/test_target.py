@@ -0,0 +1,60 @@
+"""Tests for the target class that do not need a database."""
+
+from __future__ import annotations
+
+import io
+import sys
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from singer_sdk.exceptions import InvalidInputLine
+
+from target_postgres.target import Targetpostgres
+
+CONFIG: dict[str, Any] = {
+    "host": "localhost",
+    "user": "user",
+    "password": "password",
+    "database": "database",
+}
+
+
+def test_max_parallelism_default() -> None:
+    """Without the setting the SDK default is used."""
+    assert Targetpostgres(config=CONFIG).max_parallelism == 8  # noqa: PLR2004
+
+
+def test_max_parallelism_setting() -> None:
+    """The max_parallelism setting sets how many sinks drain at once."""
+    target = Targetpostgres(config={**CONFIG, "max_parallelism": 2})
+    assert target.max_parallelism == 2  # noqa: PLR2004
+
+
+def test_max_parallelism_setter() -> None:
+    """Setting max_parallelism overrides the configured value."""
+    target = Targetpostgres(config={**CONFIG, "max_parallelism": 2})
+    target.max_parallelism = 3
+    assert target.max_parallelism == 3  # noqa: PLR2004
+
+
+def test_listen_reads_stdin_as_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Standard input is split into byte lines and every line is decoded."""
+    stdin = io.BytesIO(b'{"type": "STATE", "value": {"a": 1}}\n\n{"type": "S')
+    monkeypatch.setattr(sys, "stdin", SimpleNamespace(buffer=stdin))
+    target = Targetpostgres(config=CONFIG)
+    lines = []
+    monkeypatch.setattr(
+        target, "deserialize_json", lambda line: lines.append(line) or {"type": "X"}
+    )
+    monkeypatch.setattr(target, "_process_unknown_message", lambda _: None)
+    monkeypatch.setattr(target, "_process_endofpipe", lambda: None)
+
+    target.listen()
+    assert lines == [b'{"type": "STATE", "value": {"a": 1}}', b'{"type": "S']
+
+
+def test_deserialize_json_invalid_line() -> None:
+    """A line that is not JSON raises the SDK's InvalidInputLine."""
+    with pytest.raises(InvalidInputLine, match="not json"):
+        Targetpostgres(config=CONFIG).deserialize_json(b"not json")